@@ -76,6 +76,14 @@ typedef struct {
     
 } ModuleInterface;
 
+// Road conditions understood by the speed governor
+typedef enum {
+    ROAD_NORMAL = 0,
+    ROAD_HIGHWAY = 1,
+    ROAD_CITY = 2,
+    ROAD_SCHOOL_ZONE = 3
+} road_condition_t;
+
 // Speed governor specific interface
 typedef struct {
     int (*get_speed_limit)(int current_speed, int road_conditions);
@@ -4,6 +4,7 @@
 #include <LittleFS.h>
 #include <esp_system.h>
 #include <esp_heap_caps.h>
+#include <soc/gpio_struct.h>
 
 #include "system_api.h"
 #include "ota_updater.h"
@@ -18,6 +19,26 @@
 #define DISTANCE_SENSOR_TRIGGER_PIN 18
 #define DISTANCE_SENSOR_ECHO_PIN 19
 
+// LED pins indexed by led_type_t
+#define LED_COUNT 3
+static const uint8_t LED_PINS[LED_COUNT] = {LED_YELLOW_PIN, LED_GREEN_PIN, LED_RED_PIN};
+#define LED_PIN_MASK ((1UL << LED_YELLOW_PIN) | (1UL << LED_GREEN_PIN) | (1UL << LED_RED_PIN))
+
+// Last LED levels written (by pin bit). Starts as "all on" so the
+// all-off write in setup_gpio() is never skipped.
+static uint32_t led_output_mask = LED_PIN_MASK;
+
+// Minimum level emitted by the module logging API (override in config.h)
+#ifndef MIN_LOG_LEVEL
+#define MIN_LOG_LEVEL LOG_INFO
+#endif
+
+// Maximum LittleFS path length for module data files
+#define MODULE_DATA_PATH_MAX 64
+
+// UART transmit buffer for serial logging (bytes)
+#define SERIAL_TX_BUFFER_SIZE 2048
+
 // System state
 enum SystemState {
     STATE_INIT,
@@ -59,21 +80,24 @@ ModuleLoader module_loader;
 // Mock sensor values
 float mock_distance = 50.0;
 float mock_temperature = 25.0;
-bool button_pressed = false;
+volatile bool button_pressed = false;  // Updated from the button edge interrupt
 bool vehicle_idle = false;
 
 // Function prototypes
 void setup_gpio();
+void IRAM_ATTR button_isr();
 void setup_wifi();
 void setup_filesystem();
 void setup_system_api();
-void handle_state_machine();
-void update_sensors();
+void handle_state_machine(unsigned long current_time);
+void update_led_blink(unsigned long current_time, unsigned long interval);
+void update_sensors(unsigned long current_time);
 void log_message_impl(log_level_t level, const char* tag, const char* message);
 void log_printf_impl(log_level_t level, const char* tag, const char* format, ...);
 uint32_t get_millis_impl();
 uint64_t get_micros_impl();
 void set_led_state_impl(led_type_t led, bool is_on);
+void write_status_leds(bool yellow, bool green, bool red);
 bool get_button_state_impl();
 float read_distance_sensor_impl();
 float read_temperature_sensor_impl();
@@ -87,6 +111,8 @@ const char* get_device_id_impl();
 const char* get_module_version_impl(const char* module_name);
 
 void setup() {
+    // Larger UART TX ring buffer so log bursts don't block the main loop
+    Serial.setTxBufferSize(SERIAL_TX_BUFFER_SIZE);
     Serial.begin(115200);
     Serial.println("\n=== ESP32 Modular OTA System ===");
     Serial.println("🚀 Starting secure modular firmware platform...");
@@ -148,8 +174,11 @@ void setup() {
 }
 
 void loop() {
-    update_sensors();
-    handle_state_machine();
+    // Sample the clock once per iteration and share it
+    unsigned long current_time = millis();
+    
+    update_sensors(current_time);
+    handle_state_machine(current_time);
     
     // Update all loaded modules
     module_loader_update_all_modules(&module_loader);
@@ -167,9 +196,16 @@ void setup_gpio() {
     pinMode(DISTANCE_SENSOR_ECHO_PIN, INPUT);
     
     // Turn off all LEDs initially
-    digitalWrite(LED_YELLOW_PIN, LOW);
-    digitalWrite(LED_GREEN_PIN, LOW);
-    digitalWrite(LED_RED_PIN, LOW);
+    write_status_leds(false, false, false);
+    
+    // Track the button on edges instead of polling it
+    button_pressed = !digitalRead(BUTTON_PIN);
+    attachInterrupt(digitalPinToInterrupt(BUTTON_PIN), button_isr, CHANGE);
+}
+
+// Button edge interrupt - latch the current level (active low)
+void IRAM_ATTR button_isr() {
+    button_pressed = !digitalRead(BUTTON_PIN);
 }
 
 void setup_wifi() {
@@ -223,9 +259,7 @@ void setup_system_api() {
     system_api.get_module_version = get_module_version_impl;
 }
 
-void handle_state_machine() {
-    unsigned long current_time = millis();
-    
+void handle_state_machine(unsigned long current_time) {
     switch (current_state) {
         case STATE_NORMAL_OPERATION:
             // Check for updates periodically
@@ -257,11 +291,7 @@ void handle_state_machine() {
             
         case STATE_UPDATE_AVAILABLE:
             // Slow blink yellow LED to indicate update available
-            if (current_time - last_led_blink_time > SLOW_BLINK_INTERVAL) {
-                led_blink_state = !led_blink_state;
-                set_led_state_impl(LED_YELLOW, led_blink_state);
-                last_led_blink_time = current_time;
-            }
+            update_led_blink(current_time, SLOW_BLINK_INTERVAL);
             
             // Wait for vehicle idle state
             if (vehicle_idle) {
@@ -275,11 +305,7 @@ void handle_state_machine() {
             
         case STATE_DOWNLOADING_UPDATE:
             // Fast blink yellow LED during download
-            if (current_time - last_led_blink_time > FAST_BLINK_INTERVAL) {
-                led_blink_state = !led_blink_state;
-                set_led_state_impl(LED_YELLOW, led_blink_state);
-                last_led_blink_time = current_time;
-            }
+            update_led_blink(current_time, FAST_BLINK_INTERVAL);
             
             {
                 // Process the first pending module update
@@ -292,8 +318,7 @@ void handle_state_machine() {
                         Serial.println("   💚 Green LED: Update success");
                         
                         // Turn off blinking yellow LED and turn on solid green
-                        set_led_state_impl(LED_YELLOW, false);
-                        set_led_state_impl(LED_GREEN, true);
+                        write_status_leds(false, true, false);
                         
                         // Reload the module with new version
                         Serial.println("🔄 Reloading updated module...");
@@ -311,8 +336,7 @@ void handle_state_machine() {
                         Serial.println("   ❤️  Red LED: Update failure");
                         
                         // Turn off blinking yellow LED and turn on solid red
-                        set_led_state_impl(LED_YELLOW, false);
-                        set_led_state_impl(LED_RED, true);
+                        write_status_leds(false, false, true);
                         
                         current_state = STATE_UPDATE_FAILURE;
                         failure_state_start_time = current_time;
@@ -353,14 +377,20 @@ void handle_state_machine() {
     }
 }
 
-void update_sensors() {
-    unsigned long current_time = millis();
+// Toggle the yellow status LED once the given blink interval has elapsed
+void update_led_blink(unsigned long current_time, unsigned long interval) {
+    if (current_time - last_led_blink_time > interval) {
+        led_blink_state = !led_blink_state;
+        set_led_state_impl(LED_YELLOW, led_blink_state);
+        last_led_blink_time = current_time;
+    }
+}
+
+void update_sensors(unsigned long current_time) {
+    // Button state is maintained by button_isr(), so idle follows it every loop
+    vehicle_idle = button_pressed; // Simulate vehicle idle when button is pressed
     
     if (current_time - last_sensor_read > SENSOR_READ_INTERVAL) {
-        // Update button state
-        button_pressed = !digitalRead(BUTTON_PIN);
-        vehicle_idle = button_pressed; // Simulate vehicle idle when button is pressed
-        
         // Update mock distance sensor (simulate varying distance)
         mock_distance = 50.0 + 10.0 * sin(current_time / 5000.0);
         
@@ -375,8 +405,8 @@ void update_sensors() {
             SpeedGovernorInterface* speed_interface = (SpeedGovernorInterface*)speed_module->interface->module_functions;
             if (speed_interface && speed_interface->get_speed_limit) {
                 // Test different road conditions
-                int normal_speed_limit = speed_interface->get_speed_limit(60, 0);
-                int highway_speed_limit = speed_interface->get_speed_limit(60, 1);
+                int normal_speed_limit = speed_interface->get_speed_limit(60, ROAD_NORMAL);
+                int highway_speed_limit = speed_interface->get_speed_limit(60, ROAD_HIGHWAY);
                 
                 Serial.printf("🚗 Speed Governor v%s: Normal %d km/h | Highway %d km/h\n", 
                              speed_module->version, normal_speed_limit, highway_speed_limit);
@@ -417,11 +447,18 @@ void update_sensors() {
 
 // System API implementations
 void log_message_impl(log_level_t level, const char* tag, const char* message) {
-    const char* level_str[] = {"DEBUG", "INFO", "WARN", "ERROR"};
+    if (level < MIN_LOG_LEVEL) {
+        return;
+    }
+    static const char* const level_str[] = {"DEBUG", "INFO", "WARN", "ERROR"};
     Serial.printf("[%s] %s: %s\n", level_str[level], tag, message);
 }
 
 void log_printf_impl(log_level_t level, const char* tag, const char* format, ...) {
+    // Skip formatting entirely for filtered levels
+    if (level < MIN_LOG_LEVEL) {
+        return;
+    }
     char buffer[256];
     va_list args;
     va_start(args, format);
@@ -439,15 +476,30 @@ uint64_t get_micros_impl() {
 }
 
 void set_led_state_impl(led_type_t led, bool is_on) {
-    int pin = -1;
-    switch (led) {
-        case LED_YELLOW: pin = LED_YELLOW_PIN; break;
-        case LED_GREEN: pin = LED_GREEN_PIN; break;
-        case LED_RED: pin = LED_RED_PIN; break;
+    if ((unsigned)led >= LED_COUNT) {
+        return;
     }
-    if (pin >= 0) {
-        digitalWrite(pin, is_on ? HIGH : LOW);
+    
+    // Skip the GPIO write when the LED is already in the requested state
+    uint32_t bit = 1UL << LED_PINS[led];
+    if (((led_output_mask & bit) != 0) == is_on) {
+        return;
     }
+    led_output_mask = is_on ? (led_output_mask | bit) : (led_output_mask & ~bit);
+    digitalWrite(LED_PINS[led], is_on ? HIGH : LOW);
+}
+
+// Set all status LEDs at once using the GPIO set/clear registers
+void write_status_leds(bool yellow, bool green, bool red) {
+    uint32_t on_mask = (yellow ? (1UL << LED_YELLOW_PIN) : 0) |
+                       (green ? (1UL << LED_GREEN_PIN) : 0) |
+                       (red ? (1UL << LED_RED_PIN) : 0);
+    if (on_mask == led_output_mask) {
+        return;
+    }
+    led_output_mask = on_mask;
+    GPIO.out_w1ts = on_mask;
+    GPIO.out_w1tc = LED_PIN_MASK & ~on_mask;
 }
 
 bool get_button_state_impl() {
@@ -474,8 +526,17 @@ bool is_ignition_on_impl() {
     return true; // Always on for demo
 }
 
+// Build the LittleFS path for a module data key without heap allocation
+static bool module_data_path(const char* key, char* path, size_t path_size) {
+    int len = snprintf(path, path_size, "/module_data_%s", key);
+    return len > 0 && (size_t)len < path_size;
+}
+
 bool save_module_data_impl(const char* key, const void* data, size_t size) {
-    String filename = "/module_data_" + String(key);
+    char filename[MODULE_DATA_PATH_MAX];
+    if (!module_data_path(key, filename, sizeof(filename))) {
+        return false;
+    }
     File file = LittleFS.open(filename, "w");
     if (file) {
         size_t written = file.write((uint8_t*)data, size);
@@ -486,12 +547,15 @@ bool save_module_data_impl(const char* key, const void* data, size_t size) {
 }
 
 bool load_module_data_impl(const char* key, void* data, size_t max_size) {
-    String filename = "/module_data_" + String(key);
+    char filename[MODULE_DATA_PATH_MAX];
+    if (!module_data_path(key, filename, sizeof(filename))) {
+        return false;
+    }
     File file = LittleFS.open(filename, "r");
     if (file) {
         size_t size = file.size();
         if (size <= max_size) {
-            size_t read_bytes = file.readBytes((char*)data, size);
+            size_t read_bytes = file.read((uint8_t*)data, size);
             file.close();
             return read_bytes == size;
         }
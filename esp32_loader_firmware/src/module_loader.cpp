@@ -30,13 +30,19 @@ module_status_t module_loader_load_module(ModuleLoader* loader, const char* modu
         return MODULE_LOAD_ALREADY_LOADED;
     }
 
+    // Refuse to load past the fixed registry size
+    if (loader->loaded_count >= MAX_LOADED_MODULES) {
+        log_module_error("No free module slots");
+        return MODULE_LOAD_MEMORY_ERROR;
+    }
+
     String file_path = "/" + String(module_name) + ".bin";
-    if (!LittleFS.exists(file_path)) {
+    File file = LittleFS.open(file_path, "r");
+    if (!file) {
         log_module_error("Module file not found");
         return MODULE_LOAD_FILE_NOT_FOUND;
     }
 
-    File file = LittleFS.open(file_path, "r");
     size_t file_size = file.size();
     if (file_size == 0) {
         log_module_error("Module file is empty");
@@ -135,7 +141,8 @@ bool module_loader_is_module_loaded(ModuleLoader* loader, const char* module_nam
 void module_loader_update_all_modules(ModuleLoader* loader) {
     if (!loader) return;
     
-    for (int i = 0; i < MAX_LOADED_MODULES; i++) {
+    // Loaded modules are kept packed at the front of the array
+    for (int i = 0; i < loader->loaded_count; i++) {
         LoadedModule* module = &loader->modules[i];
         if (module->is_active && module->interface && module->interface->update) {
             module->interface->update();
@@ -162,7 +169,7 @@ void module_loader_list_loaded_modules(ModuleLoader* loader) {
 
 // Internal helper functions
 static LoadedModule* find_loaded_module(ModuleLoader* loader, const char* module_name) {
-    for (int i = 0; i < MAX_LOADED_MODULES; i++) {
+    for (int i = 0; i < loader->loaded_count; i++) {
         LoadedModule* module = &loader->modules[i];
         if (module->is_active && strcmp(module->name, module_name) == 0) {
             return module;
@@ -10,12 +10,17 @@
 #include "mbedtls/sha256.h"
 #include "mbedtls/base64.h"
 
+// Read buffer size used when hashing module files
+#define HASH_READ_BUFFER_SIZE 1024
+
 // Internal functions
 static bool download_manifest(OTAUpdater* updater, StaticJsonDocument<2048>& manifest);
 static bool parse_manifest_for_updates(OTAUpdater* updater, const StaticJsonDocument<2048>& manifest);
 static bool download_file_from_url(const char* url, const char* local_path);
 static bool calculate_sha256(const char* file_path, char* hash_output);
 static bool calculate_file_hash_raw(const char* file_path, unsigned char* hash_output);
+static void hash_to_hex(const unsigned char* hash, char* hex_output);
+static bool verify_signature(const unsigned char* file_hash, const char* signature_b64, const char* public_key_pem);
 static void log_error(const char* message);
 static void log_info(const char* message);
 
@@ -121,13 +126,15 @@ update_status_t ota_updater_download_and_apply_update(OTAUpdater* updater, const
         return UPDATE_DOWNLOAD_FAILED;
     }
     
-    // SECURITY: Calculate hash of downloaded file
-    char calculated_hash[65];
-    if (!calculate_sha256(temp_binary_path.c_str(), calculated_hash)) {
+    // SECURITY: Calculate hash of downloaded file (once, reused for the signature check)
+    unsigned char file_hash[32];
+    if (!calculate_file_hash_raw(temp_binary_path.c_str(), file_hash)) {
         log_error("Hash calculation failed");
         LittleFS.remove(temp_binary_path);
         return UPDATE_VERIFICATION_FAILED;
     }
+    char calculated_hash[65];
+    hash_to_hex(file_hash, calculated_hash);
 
     // SECURITY: Verify against manifest hash (authoritative source)
     if (strcmp(calculated_hash, update_info->sha256_hash) != 0) {
@@ -142,7 +149,7 @@ update_status_t ota_updater_download_and_apply_update(OTAUpdater* updater, const
 
     // SECURITY: Verify digital signature (using demo signature for now)
     const char* demo_signature = "placeholder-for-demo-signature";
-    if (!verify_signature(temp_binary_path.c_str(), demo_signature, updater->public_key_pem)) {
+    if (!verify_signature(file_hash, demo_signature, updater->public_key_pem)) {
         log_error("CRITICAL: Digital signature verification failed!");
         Serial.println("  Update rejected - signature invalid");
         LittleFS.remove(temp_binary_path);
@@ -298,8 +305,8 @@ const char* ota_updater_get_module_version(OTAUpdater* updater, const char* modu
 }
 
 // Add signature verification function
-static bool verify_signature(const char* file_path, const char* signature_b64, const char* public_key_pem) {
-    if (!file_path || !signature_b64 || !public_key_pem) {
+static bool verify_signature(const unsigned char* file_hash, const char* signature_b64, const char* public_key_pem) {
+    if (!file_hash || !signature_b64 || !public_key_pem) {
         log_error("Invalid parameters for signature verification");
         return false;
     }
@@ -315,6 +322,8 @@ static bool verify_signature(const char* file_path, const char* signature_b64, c
     
     int ret = 0;
     bool verification_result = false;
+    unsigned char signature[256]; // RSA-2048 signature is 256 bytes
+    size_t signature_len = 0;
     
     // Parse the public key
     ret = mbedtls_pk_parse_public_key(&pk, (const unsigned char*)public_key_pem, strlen(public_key_pem) + 1);
@@ -325,18 +334,7 @@ static bool verify_signature(const char* file_path, const char* signature_b64, c
         goto cleanup;
     }
     
-    // Calculate SHA256 hash of the file
-    unsigned char file_hash[32];
-    ret = calculate_file_hash_raw(file_path, file_hash);
-    if (!ret) {
-        log_error("Failed to calculate file hash for signature verification");
-        goto cleanup;
-    }
-    
     // Base64 decode the signature
-    unsigned char signature[256]; // RSA-2048 signature is 256 bytes
-    size_t signature_len = 0;
-    
     ret = mbedtls_base64_decode(signature, sizeof(signature), &signature_len, 
                                (const unsigned char*)signature_b64, strlen(signature_b64));
     if (ret != 0) {
@@ -345,7 +343,7 @@ static bool verify_signature(const char* file_path, const char* signature_b64, c
     }
     
     // Verify the signature
-    ret = mbedtls_pk_verify(&pk, MBEDTLS_MD_SHA256, file_hash, sizeof(file_hash), signature, signature_len);
+    ret = mbedtls_pk_verify(&pk, MBEDTLS_MD_SHA256, file_hash, 32, signature, signature_len);
     if (ret == 0) {
         log_info("Signature verification PASSED");
         verification_result = true;
@@ -366,14 +364,16 @@ static bool download_manifest(OTAUpdater* updater, StaticJsonDocument<2048>& man
     HTTPClient http;
     String url = String(updater->server_url) + updater->manifest_path;
     
+    // HTTP/1.0 avoids chunked encoding so the body can be parsed straight from the stream
+    http.useHTTP10(true);
     http.begin(url);
     http.addHeader("Content-Type", "application/json");
     
     int httpCode = http.GET();
     
     if (httpCode == HTTP_CODE_OK) {
-        String payload = http.getString();
-        DeserializationError error = deserializeJson(manifest, payload);
+        // Parse directly from the socket instead of buffering the whole body in a String
+        DeserializationError error = deserializeJson(manifest, http.getStream());
         
         if (error) {
             log_error("Manifest JSON parsing failed");
@@ -507,37 +507,23 @@ static bool download_file_from_url(const char* url, const char* local_path) {
 }
 
 static bool calculate_sha256(const char* file_path, char* hash_output) {
-    File file = LittleFS.open(file_path, "r");
-    if (!file) {
+    unsigned char hash[32];
+    if (!calculate_file_hash_raw(file_path, hash)) {
         return false;
     }
     
-    mbedtls_md_context_t ctx;
-    mbedtls_md_type_t md_type = MBEDTLS_MD_SHA256;
-    
-    mbedtls_md_init(&ctx);
-    mbedtls_md_setup(&ctx, mbedtls_md_info_from_type(md_type), 0);
-    mbedtls_md_starts(&ctx);
-    
-    uint8_t buffer[512];
-    while (file.available()) {
-        size_t bytesRead = file.readBytes((char*)buffer, sizeof(buffer));
-        mbedtls_md_update(&ctx, buffer, bytesRead);
-    }
-    
-    uint8_t hash[32];
-    mbedtls_md_finish(&ctx, hash);
-    mbedtls_md_free(&ctx);
-    
-    file.close();
+    hash_to_hex(hash, hash_output);
+    return true;
+}
+
+static void hash_to_hex(const unsigned char* hash, char* hex_output) {
+    static const char hex_digits[] = "0123456789abcdef";
     
-    // Convert to hex string
     for (int i = 0; i < 32; i++) {
-        sprintf(hash_output + (i * 2), "%02x", hash[i]);
+        hex_output[i * 2] = hex_digits[hash[i] >> 4];
+        hex_output[i * 2 + 1] = hex_digits[hash[i] & 0x0f];
     }
-    hash_output[64] = '\0';
-    
-    return true;
+    hex_output[64] = '\0';
 }
 
 static bool calculate_file_hash_raw(const char* file_path, unsigned char* hash_output) {
@@ -550,12 +536,17 @@ static bool calculate_file_hash_raw(const char* file_path, unsigned char* hash_o
     mbedtls_md_type_t md_type = MBEDTLS_MD_SHA256;
     
     mbedtls_md_init(&ctx);
-    mbedtls_md_setup(&ctx, mbedtls_md_info_from_type(md_type), 0);
+    if (mbedtls_md_setup(&ctx, mbedtls_md_info_from_type(md_type), 0) != 0) {
+        mbedtls_md_free(&ctx);
+        file.close();
+        return false;
+    }
     mbedtls_md_starts(&ctx);
     
-    uint8_t buffer[512];
-    while (file.available()) {
-        size_t bytesRead = file.readBytes((char*)buffer, sizeof(buffer));
+    // Read straight into the buffer (no Stream timeout handling) in large chunks
+    uint8_t buffer[HASH_READ_BUFFER_SIZE];
+    size_t bytesRead;
+    while ((bytesRead = file.read(buffer, sizeof(buffer))) > 0) {
         mbedtls_md_update(&ctx, buffer, bytesRead);
     }
     
@@ -1,11 +1,14 @@
 #include "../../esp32_loader_firmware/include/system_api.h"
 #include <stddef.h>
-#include <math.h>  // Added for fabsf()
 
 // Module metadata - Version 1.0.0
 #define MODULE_NAME "distance_sensor"
 #define MODULE_VERSION "1.1.0"  // Version 1.0.0 - outputs in centimeters
 
+// Valid measurement range in centimeters
+#define MIN_DISTANCE_CM 0.0f
+#define MAX_DISTANCE_CM 400.0f
+
 // Global system API pointer
 static SystemAPI* sys_api = NULL;
 
@@ -80,24 +83,18 @@ static void update_module(void) {
     float raw_distance = sys_api->read_distance_sensor();
     
     // Apply calibration offset and convert to centimeters
-    last_distance_reading = raw_distance + calibration_offset;
+    float distance = raw_distance + calibration_offset;
     
-    // Ensure reasonable bounds
-    if (last_distance_reading < 0.0f) {
-        last_distance_reading = 0.0f;
-    }
-    if (last_distance_reading > 400.0f) {  // 4 meter max range
-        last_distance_reading = 400.0f;
-    }
+    // Clamp to the sensor's reasonable bounds (4 meter max range)
+    distance = (distance < MIN_DISTANCE_CM) ? MIN_DISTANCE_CM : distance;
+    last_distance_reading = (distance > MAX_DISTANCE_CM) ? MAX_DISTANCE_CM : distance;
     
     // Log distance reading periodically (every ~10 seconds)
     static uint32_t last_log_time = 0;
     uint32_t current_time = sys_api->get_millis();
     if (current_time - last_log_time > 10000) {
-        int cm = (int)last_distance_reading;
-        int decimal = (int)(fabsf(last_distance_reading * 10.0f)) % 10;
         sys_api->log_printf(LOG_INFO, MODULE_NAME, 
-                           "Distance: %d.%d cm (v1.0.0)", cm, decimal);
+                           "Distance: %.1f cm (v1.0.0)", last_distance_reading);
         last_log_time = current_time;
     }
 }
@@ -118,12 +115,9 @@ static void calibrate_sensor(void) {
     calibration_offset = 30.0f - raw_reading;
     sensor_calibrated = true;
 
-    int cm = (int)calibration_offset;
-    int decimal = (int)(fabsf(calibration_offset * 100.0f)) % 100;
-
     sys_api->log_printf(LOG_INFO, MODULE_NAME,
-        "Calibration complete. Offset: %d.%02d cm",
-        cm, decimal);
+        "Calibration complete. Offset: %.2f cm",
+        calibration_offset);
 }
 
 static bool is_object_detected(float threshold) {
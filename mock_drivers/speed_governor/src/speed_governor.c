@@ -5,6 +5,10 @@
 #define MODULE_NAME "speed_governor"
 #define MODULE_VERSION "1.1.1"  // Updated version
 
+// Status log period and fixed school zone limit
+#define STATUS_LOG_INTERVAL_MS 10000
+#define SCHOOL_ZONE_SPEED_LIMIT 25  // Very low speed in school zones
+
 // Global system API pointer
 static SystemAPI* sys_api = NULL;
 
@@ -14,6 +18,16 @@ static int override_speed_limit = -1; // -1 means no override
 static bool speed_limiting_active = true;
 static int highway_speed_limit = 100; // NEW: Highway speed limit
 
+// Last limits reported at INFO level, so repeated queries log at DEBUG
+static int announced_highway_limit = -1;
+static bool school_zone_announced = false;
+
+// Persisted limits, saved together under a single storage key
+typedef struct {
+    int speed_limit;
+    int highway_speed_limit;
+} SavedSpeedLimits;
+
 // Function prototypes for module interface
 static bool initialize_module(SystemAPI* api);
 static void deinitialize_module(void);
@@ -51,20 +65,29 @@ static bool initialize_module(SystemAPI* api) {
     }
     
     sys_api = api;
+    announced_highway_limit = -1;
+    school_zone_announced = false;
     
-    // Load saved configuration if any
-    int saved_limit;
-    if (sys_api->load_module_data("speed_limit", &saved_limit, sizeof(saved_limit))) {
-        current_speed_limit = saved_limit;
+    // Load saved configuration if any (one file read for both limits)
+    SavedSpeedLimits saved;
+    if (sys_api->load_module_data("speed_limits", &saved, sizeof(saved))) {
+        current_speed_limit = saved.speed_limit;
+        highway_speed_limit = saved.highway_speed_limit;
         sys_api->log_printf(LOG_INFO, MODULE_NAME, "Loaded saved speed limit: %d km/h", current_speed_limit);
     } else {
-        sys_api->log_printf(LOG_INFO, MODULE_NAME, "Using default speed limit: %d km/h", current_speed_limit);
-    }
-    
-    // Load highway speed limit
-    int saved_highway_limit;
-    if (sys_api->load_module_data("highway_speed_limit", &saved_highway_limit, sizeof(saved_highway_limit))) {
-        highway_speed_limit = saved_highway_limit;
+        // Fall back to the per-key format written by older versions
+        int saved_limit;
+        if (sys_api->load_module_data("speed_limit", &saved_limit, sizeof(saved_limit))) {
+            current_speed_limit = saved_limit;
+            sys_api->log_printf(LOG_INFO, MODULE_NAME, "Loaded saved speed limit: %d km/h", current_speed_limit);
+        } else {
+            sys_api->log_printf(LOG_INFO, MODULE_NAME, "Using default speed limit: %d km/h", current_speed_limit);
+        }
+        
+        int saved_highway_limit;
+        if (sys_api->load_module_data("highway_speed_limit", &saved_highway_limit, sizeof(saved_highway_limit))) {
+            highway_speed_limit = saved_highway_limit;
+        }
     }
     
     sys_api->log_printf(LOG_INFO, MODULE_NAME, "Speed Governor v%s initialized (highway limit: %d km/h)", 
@@ -74,9 +97,12 @@ static bool initialize_module(SystemAPI* api) {
 
 static void deinitialize_module(void) {
     if (sys_api) {
-        // Save current configuration
-        sys_api->save_module_data("speed_limit", &current_speed_limit, sizeof(current_speed_limit));
-        sys_api->save_module_data("highway_speed_limit", &highway_speed_limit, sizeof(highway_speed_limit));
+        // Save current configuration in a single write
+        SavedSpeedLimits saved = {
+            .speed_limit = current_speed_limit,
+            .highway_speed_limit = highway_speed_limit
+        };
+        sys_api->save_module_data("speed_limits", &saved, sizeof(saved));
         sys_api->log_message(LOG_INFO, MODULE_NAME, "Speed Governor module deinitialized");
         sys_api = NULL;
     }
@@ -84,16 +110,19 @@ static void deinitialize_module(void) {
 
 static void update_module(void) {
     // This function is called periodically from the main loop
+    if (!sys_api) {
+        return;
+    }
+    
     static uint32_t last_log_time = 0;
     uint32_t current_time = sys_api->get_millis();
     
     // Log status every 10 seconds
-    if (current_time - last_log_time > 10000) {
-        uint32_t vehicle_speed = sys_api->get_vehicle_speed();
-        bool vehicle_idle = sys_api->is_vehicle_idle();
-        
-        if (!vehicle_idle && speed_limiting_active) {
+    if (current_time - last_log_time > STATUS_LOG_INTERVAL_MS) {
+        // Only query vehicle state when limiting is active and the vehicle is moving
+        if (speed_limiting_active && !sys_api->is_vehicle_idle()) {
             int effective_limit = (override_speed_limit > 0) ? override_speed_limit : current_speed_limit;
+            int vehicle_speed = (int)sys_api->get_vehicle_speed();
             
             if (vehicle_speed > effective_limit) {
                 sys_api->log_printf(LOG_WARN, MODULE_NAME, 
@@ -121,24 +150,31 @@ static int get_speed_limit(int current_speed, int road_conditions) {
     // FIXED LOGIC - Version 1.1.0: Now properly handles highway conditions
     // This fixes the TATA EV Nexon highway issue!
     
-    if (road_conditions == 0) { // Normal conditions
-        sys_api->log_printf(LOG_DEBUG, MODULE_NAME, "Normal conditions, speed limit: %d km/h", current_speed_limit);
-        return current_speed_limit;
-    } else if (road_conditions == 1) { // Highway conditions - FIXED!
-        // NEW: Allow higher speeds on highway
-        sys_api->log_printf(LOG_INFO, MODULE_NAME, "Highway detected, allowing higher speed: %d km/h", highway_speed_limit);
-        return highway_speed_limit; // This fixes the 40 km/h highway problem!
-    } else if (road_conditions == 2) { // City conditions
-        int city_limit = current_speed_limit - 10;
-        sys_api->log_printf(LOG_DEBUG, MODULE_NAME, "City conditions, speed limit: %d km/h", city_limit);
-        return city_limit;
-    } else if (road_conditions == 3) { // School zone
-        int school_limit = 25; // Very low speed in school zones
-        sys_api->log_printf(LOG_INFO, MODULE_NAME, "School zone detected, speed limit: %d km/h", school_limit);
-        return school_limit;
+    switch (road_conditions) {
+        case ROAD_NORMAL:
+            sys_api->log_printf(LOG_DEBUG, MODULE_NAME, "Normal conditions, speed limit: %d km/h", current_speed_limit);
+            return current_speed_limit;
+        case ROAD_HIGHWAY: // FIXED!
+            // NEW: Allow higher speeds on highway (announced at INFO only when the limit changes)
+            sys_api->log_printf(highway_speed_limit != announced_highway_limit ? LOG_INFO : LOG_DEBUG, MODULE_NAME,
+                               "Highway detected, allowing higher speed: %d km/h", highway_speed_limit);
+            announced_highway_limit = highway_speed_limit;
+            return highway_speed_limit; // This fixes the 40 km/h highway problem!
+        case ROAD_CITY: {
+            int city_limit = current_speed_limit - 10;
+            sys_api->log_printf(LOG_DEBUG, MODULE_NAME, "City conditions, speed limit: %d km/h", city_limit);
+            return city_limit;
+        }
+        case ROAD_SCHOOL_ZONE: {
+            int school_limit = SCHOOL_ZONE_SPEED_LIMIT;
+            sys_api->log_printf(school_zone_announced ? LOG_DEBUG : LOG_INFO, MODULE_NAME,
+                               "School zone detected, speed limit: %d km/h", school_limit);
+            school_zone_announced = true;
+            return school_limit;
+        }
+        default:
+            return current_speed_limit;
     }
-    
-    return current_speed_limit;
 }
 
 static void set_speed_limit_override(int new_limit) {